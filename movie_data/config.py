@@ -572,6 +572,11 @@ class ShowtimeGenerationConfig:
     def parallel_processing_enabled(self) -> bool:
         """Whether parallel state processing is enabled."""
         return self.showtimes.get("state_filter", {}).get("parallel_processing", True)
+    
+    @property
+    def insert_batch_size(self) -> int:
+        """Number of generated showtimes to buffer before each insert."""
+        return self.showtimes.get("insert_batch_size", 10000)
 
 
 class Config:
@@ -12,18 +12,26 @@ import time
 import logging
 import random
 import re
+import string
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import orjson
 import requests
 from dotenv import load_dotenv
 from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.operations import UpdateOne
+from pymongo.errors import BulkWriteError
+from pymongo.operations import UpdateMany, UpdateOne
+from pymongo.write_concern import WriteConcern
 from tqdm import tqdm
 import argparse
 import concurrent.futures
+import contextlib
+import functools
+import itertools
 
 # Import configuration module
 from config import get_config, reload_config, Config
@@ -89,6 +97,156 @@ def log_progress(message, city=None, level="info"):
         print(f"[{time_str}] {message}")
 
 
+@functools.lru_cache(maxsize=1)
+def get_mongo_client() -> MongoClient:
+    """
+    Get the MongoDB client shared by every data class in this module.
+    
+    The client is created on first use and later calls reuse its connection
+    pool. It is not pinged: server discovery happens on the first operation,
+    and the classes below fail fast when creating their indexes, or, for
+    DataExporter, with a single ping.
+    
+    Returns:
+        MongoClient: Shared client
+    """
+    client = MongoClient(
+        MONGODB_CONNECTION_STRING,
+        # A single ingest process needs only a small pool
+        maxPoolSize=16,
+        minPoolSize=5,
+        # Theater and showtime documents are repetitive and compress well;
+        # zlib is used when the zstandard extra is not installed
+        compressors="zstd,zlib",
+        zlibCompressionLevel=3,
+        serverSelectionTimeoutMS=3000,
+        socketTimeoutMS=60000,
+        retryWrites=True
+    )
+    return client
+
+
+def summarize_bulk_write_error(error: BulkWriteError) -> Tuple[int, Set[int], Optional[str]]:
+    """
+    Summarize a BulkWriteError raised by an unordered insert_many.
+    
+    Unordered inserts keep going past failed documents, so every document
+    outside the failed indexes was written.
+    
+    Args:
+        error: The raised BulkWriteError
+        
+    Returns:
+        Tuple of (documents inserted, indexes of failed documents, first error message)
+    """
+    write_errors = error.details.get("writeErrors") or []
+    failed_indexes = {write_error["index"] for write_error in write_errors if "index" in write_error}
+    first_errmsg = write_errors[0].get("errmsg") if write_errors else None
+    return error.details.get("nInserted", 0), failed_indexes, first_errmsg
+
+
+@dataclass
+class Theater:
+    """
+    Generated theater record.
+
+    Uses a fixed slot layout instead of a per-theater dict; converted to a
+    plain document only when it is written to MongoDB or JSON.
+    """
+    __slots__ = (
+        "unique_id", "name", "brand", "source_city", "city_geoid",
+        "location", "address", "contact", "features", "last_updated"
+    )
+
+    unique_id: str
+    name: str
+    brand: str
+    source_city: str
+    city_geoid: str
+    location: Dict[str, Any]
+    address: Dict[str, Any]
+    contact: Dict[str, Any]
+    features: List[str]
+    last_updated: str
+
+    def to_document(self) -> Dict[str, Any]:
+        """Convert the theater to a MongoDB/JSON document."""
+        return {
+            'unique_id': self.unique_id,
+            'name': self.name,
+            'brand': self.brand,
+            'source_city': self.source_city,
+            'city_geoid': self.city_geoid,
+            'location': self.location,
+            'address': self.address,
+            'contact': self.contact,
+            'features': self.features,
+            'last_updated': self.last_updated
+        }
+
+
+def theaters_to_documents(theaters: List[Union[Theater, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Convert Theater records to documents, passing plain dicts through unchanged."""
+    return [theater.to_document() if isinstance(theater, Theater) else theater for theater in theaters]
+
+
+NAME_PATTERN_FIELDS = ("brand", "city", "number", "suffix")
+
+
+def compile_name_pattern(pattern: str) -> Callable[[str, str, str, str], str]:
+    """
+    Compile a theater naming pattern into a formatter function.
+    
+    The pattern is parsed once and turned into an equivalent f-string lambda,
+    so formatting a name no longer re-parses the pattern on every call.
+    Patterns with unknown fields, format specs or conversions fall back to
+    str.format.
+    
+    Args:
+        pattern: Naming pattern such as "{brand} {city} {number}"
+        
+    Returns:
+        Function taking (brand, city, number, suffix) and returning the stripped name
+    """
+    body = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(pattern):
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if field_name not in NAME_PATTERN_FIELDS or format_spec or conversion:
+            return lambda brand, city, number, suffix: pattern.format(
+                brand=brand, city=city, number=number, suffix=suffix
+            ).strip()
+        body.append("{" + field_name + "}")
+    
+    source = f"lambda brand, city, number, suffix: f{''.join(body)!r}.strip()"
+    return eval(source, {"__builtins__": {}})
+
+
+# Number of distinct values for each part of a synthetic phone number and ZIP code
+_AREA_CODES = 800      # 200-999
+_PHONE_PREFIXES = 800  # 200-999
+_LINE_NUMBERS = 9000   # 1000-9999
+_ZIP_CODES = 90000     # 10000-99999
+_PHONE_ZIP_SPAN = _AREA_CODES * _PHONE_PREFIXES * _LINE_NUMBERS * _ZIP_CODES
+
+
+def random_phone_and_zip() -> Tuple[str, str]:
+    """
+    Generate a random phone number and ZIP code from a single random draw.
+    
+    Returns:
+        Tuple of (phone, zip) strings, e.g. ("(813) 555-1234", "33602")
+    """
+    value, zip_code = divmod(random.randrange(_PHONE_ZIP_SPAN), _ZIP_CODES)
+    value, line_number = divmod(value, _LINE_NUMBERS)
+    area_code, prefix = divmod(value, _PHONE_PREFIXES)
+    return (
+        f"({area_code + 200}) {prefix + 200}-{line_number + 1000}",
+        f"{zip_code + 10000}"
+    )
+
+
 class MovieData:
     """Class for fetching and managing movie data from TMDB API."""
     
@@ -113,9 +271,7 @@ class MovieData:
         try:
             # Connect to MongoDB
             log_progress("Connecting to MongoDB for movie data...", level="info")
-            self.client = MongoClient(MONGODB_CONNECTION_STRING)
-            # Test connection
-            self.client.admin.command('ping')
+            self.client = get_mongo_client()
             
             self.db = self.client[MONGODB_DATABASE]
             
@@ -391,6 +547,8 @@ class MovieData:
             # Extract related data for separate collections
             cast = movie.pop("cast", [])
             directors = movie.pop("directors", [])
+            # All related records saved with this movie share one timestamp
+            last_updated = datetime.now().isoformat()
             
             # Update or insert movie
             self.movies_collection.update_one(
@@ -400,41 +558,52 @@ class MovieData:
             )
             
             # Process directors
-            for director in directors:
-                self.directors_collection.update_one(
+            director_operations = [
+                UpdateOne(
                     {"id": director["id"]},
                     {"$set": {
                         **director,
-                        "last_updated": datetime.now().isoformat()
+                        "last_updated": last_updated
                     }},
                     upsert=True
                 )
+                for director in directors
+            ]
+            if director_operations:
+                self.directors_collection.bulk_write(director_operations, ordered=False)
             
             # Process actors
-            for actor in cast:
-                self.actors_collection.update_one(
+            actor_operations = [
+                UpdateOne(
                     {"id": actor["id"]},
                     {"$set": {
                         **actor,
-                        "last_updated": datetime.now().isoformat()
+                        "last_updated": last_updated
                     }},
                     upsert=True
                 )
+                for actor in cast
+            ]
+            if actor_operations:
+                self.actors_collection.bulk_write(actor_operations, ordered=False)
             
             # Process genres
+            genre_operations = []
             for genre_id in movie.get("genres", []):
                 # Get genre info from the original movie data
                 genre_name = next((genre["name"] for genre in movie.get("genres_original", []) if genre["id"] == genre_id), "Unknown")
                 
-                self.genres_collection.update_one(
+                genre_operations.append(UpdateOne(
                     {"id": genre_id},
                     {"$set": {
                         "id": genre_id,
                         "name": genre_name,
-                        "last_updated": datetime.now().isoformat()
+                        "last_updated": last_updated
                     }},
                     upsert=True
-                )
+                ))
+            if genre_operations:
+                self.genres_collection.bulk_write(genre_operations, ordered=False)
             
             return True
         except Exception as e:
@@ -522,10 +691,13 @@ class MovieData:
             "genres": set(),
             "start_time": datetime.now().isoformat()
         }
+        # Genre ID -> name for the genres of saved movies
+        genre_names = {}
         
         try:
-            # Check current movie count in database
-            current_count = self.movies_collection.count_documents({})
+            # Check current movie count in database; an unfiltered total can
+            # come from collection metadata instead of a scan
+            current_count = self.movies_collection.estimated_document_count()
             log_progress(f"Current movie count in database: {current_count}", level="info")
             
             # If we already have enough movies, skip fetching
@@ -579,6 +751,7 @@ class MovieData:
                         # Track genres
                         for genre in movie.get("genres", []):
                             stats["genres"].add(genre.get("name"))
+                            genre_names[genre.get("id")] = genre.get("name")
                     
                 except Exception as e:
                     log_progress(f"Error processing movie {movie.get('title', 'Unknown')}: {str(e)}", level="error")
@@ -587,15 +760,19 @@ class MovieData:
             stats["end_time"] = datetime.now().isoformat()
             stats["genres"] = list(stats["genres"])
             
-            # Get final count
-            final_count = self.movies_collection.count_documents({})
+            # Get the final count from collection metadata
+            final_count = self.movies_collection.estimated_document_count()
             log_progress(f"Movie data collection complete. Total movies in database: {final_count}", level="info")
             
-            # Generate summary statistics
-            genres_summary = {}
-            for genre_name in stats["genres"]:
-                count = self.movies_collection.count_documents({"genres_original.name": genre_name})
-                genres_summary[genre_name] = count
+            # Generate summary statistics; stored movies keep their genres
+            # as a list of genre IDs
+            genre_counts = self.movies_collection.aggregate([
+                {"$match": {"genres": {"$in": list(genre_names)}}},
+                {"$unwind": "$genres"},
+                {"$match": {"genres": {"$in": list(genre_names)}}},
+                {"$group": {"_id": "$genres", "count": {"$sum": 1}}}
+            ])
+            genres_summary = {genre_names[genre["_id"]]: genre["count"] for genre in genre_counts}
             
             log_progress("Genre statistics:", level="info")
             for genre, count in sorted(genres_summary.items(), key=lambda x: x[1], reverse=True):
@@ -626,13 +803,17 @@ class TheaterData:
         # Target theater chains from configuration
         self.target_theaters = self.config.theater.theater_brands
         
+        # Compiled naming patterns keyed by (brand, city_size)
+        self._name_formatters = {}
+        
+        # Theater IDs already in use, loaded on first ID generation
+        self._known_theater_ids = None
+        
         # MongoDB connection
         try:
             # Connect to MongoDB
             log_progress("Connecting to MongoDB...", level="info")
-            self.client = MongoClient(MONGODB_CONNECTION_STRING)
-            # Test connection
-            self.client.admin.command('ping')
+            self.client = get_mongo_client()
             
             self.db = self.client[MONGODB_DATABASE]
             
@@ -643,9 +824,23 @@ class TheaterData:
             
             # Create indexes
             self.cities_collection.create_index("geoid", unique=True)
+            self.cities_collection.create_index([("processed", 1), ("population", -1)])
+            self.cities_collection.create_index([("processed", 1), ("random_key", 1)])
             self.theaters_collection.create_index("unique_id")
             self.theaters_collection.create_index("brand")
             self.theaters_collection.create_index("city_geoid")
+            # Rejects duplicate IDs from concurrent writers; the filter matches
+            # the known-ID load so that query can be answered from this index
+            self.theaters_collection.create_index(
+                "theater_id",
+                unique=True,
+                partialFilterExpression={"theater_id": {"$exists": True}}
+            )
+            # get_last_progress reads the newest entry
+            self.progress_collection.create_index([("timestamp", -1)])
+            
+            # Unprocessed cities are queried by equality, so the flag must never be missing
+            self.normalize_city_processed_flags()
             
             log_progress("MongoDB connection successful", level="info")
         except Exception as e:
@@ -692,7 +887,7 @@ class TheaterData:
         try:
             # Get total number of unprocessed cities
             stats["total_cities"] = self.cities_collection.count_documents({
-                "processed": {"$ne": True},
+                "processed": False,
                 "population": {"$exists": True, "$ne": None}
             })
             
@@ -702,46 +897,43 @@ class TheaterData:
             
             log_progress(f"Found {stats['total_cities']} unprocessed cities to process", level="info")
             
-            # Process cities in batches
+            # Process cities in batches pulled from a single cursor
             batch_num = 1
-            while True:
-                # Check if we've reached max batches
-                if max_batches and batch_num > max_batches:
-                    log_progress(f"Reached maximum number of batches ({max_batches})", level="info")
-                    break
-                
-                # Get next batch of cities
-                cities = list(self.cities_collection.find(
-                    {"processed": {"$ne": True}, "population": {"$exists": True, "$ne": None}},
-                    sort=[("population", -1)],  # Process largest cities first
-                    limit=batch_size
-                ))
-                
-                if not cities:
-                    log_progress("No more cities to process", level="info")
-                    break
-                
-                log_progress(f"Processing batch {batch_num} with {len(cities)} cities", level="info")
-                
-                # Process this batch
-                batch_stats = self.process_batch_of_cities(cities)
-                
-                # Update overall statistics
-                stats["processed_cities"] += batch_stats["processed_cities"]
-                stats["theaters_found"] += batch_stats["theaters_found"]
-                stats["errors"] += batch_stats["errors"]
-                stats["batches_completed"] += 1
-                
-                # Log progress
-                progress = (stats["processed_cities"] / stats["total_cities"]) * 100
-                log_progress(f"Progress: {progress:.1f}% ({stats['processed_cities']}/{stats['total_cities']} cities)", level="info")
-                
-                # Add delay between batches
-                if delay_between_batches > 0:
-                    log_progress(f"Waiting {delay_between_batches} seconds before next batch", level="info")
-                    time.sleep(delay_between_batches)
-                
-                batch_num += 1
+            with contextlib.closing(self._iter_unprocessed_cities(batch_size)) as unprocessed_cities:
+                while True:
+                    # Check if we've reached max batches
+                    if max_batches and batch_num > max_batches:
+                        log_progress(f"Reached maximum number of batches ({max_batches})", level="info")
+                        break
+                    
+                    # Get next batch of cities
+                    cities = list(itertools.islice(unprocessed_cities, batch_size))
+                    
+                    if not cities:
+                        log_progress("No more cities to process", level="info")
+                        break
+                    
+                    log_progress(f"Processing batch {batch_num} with {len(cities)} cities", level="info")
+                    
+                    # Process this batch
+                    batch_stats = self.process_batch_of_cities(cities)
+                    
+                    # Update overall statistics
+                    stats["processed_cities"] += batch_stats["processed_cities"]
+                    stats["theaters_found"] += batch_stats["theaters_found"]
+                    stats["errors"] += batch_stats["errors"]
+                    stats["batches_completed"] += 1
+                    
+                    # Log progress
+                    progress = (stats["processed_cities"] / stats["total_cities"]) * 100
+                    log_progress(f"Progress: {progress:.1f}% ({stats['processed_cities']}/{stats['total_cities']} cities)", level="info")
+                    
+                    # Add delay between batches
+                    if delay_between_batches > 0:
+                        log_progress(f"Waiting {delay_between_batches} seconds before next batch", level="info")
+                        time.sleep(delay_between_batches)
+                    
+                    batch_num += 1
             
             stats["end_time"] = datetime.now().isoformat()
             log_progress("City processing complete", level="info")
@@ -753,19 +945,77 @@ class TheaterData:
             stats["end_time"] = datetime.now().isoformat()
             return stats
 
+    def _iter_unprocessed_cities(self, batch_size: int):
+        """
+        Stream unprocessed cities, largest population first, from one cursor.
+        
+        The cursor is backed by the (processed, population) index and kept open
+        across batches, so cities are not re-queried and re-sorted per batch.
+        
+        Args:
+            batch_size: Number of documents to fetch per server round trip
+            
+        Yields:
+            City documents
+        """
+        cursor = self.cities_collection.find(
+            {"processed": False, "population": {"$exists": True, "$ne": None}},
+            sort=[("population", -1)],  # Process largest cities first
+            no_cursor_timeout=True
+        ).batch_size(batch_size)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+    
+    def get_cities_by_population(self, limit: int = None) -> List[Dict]:
+        """
+        Get unprocessed cities, largest population first.
+        
+        Args:
+            limit: Maximum number of cities to return; None or 0 returns all
+            
+        Returns:
+            List of city documents
+        """
+        cursor = self.cities_collection.find(
+            {"processed": False, "population": {"$exists": True, "$ne": None}},
+            sort=[("population", -1)]
+        )
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+    
+    def _load_known_theater_ids(self) -> set:
+        """Stream the theater IDs already stored in MongoDB into memory once."""
+        if self._known_theater_ids is None:
+            cursor = self.theaters_collection.find(
+                {"theater_id": {"$exists": True}},
+                {"_id": 0, "theater_id": 1}
+            ).batch_size(10000)
+            self._known_theater_ids = {doc["theater_id"] for doc in cursor}
+            log_progress(f"Loaded {len(self._known_theater_ids)} existing theater IDs", level="debug")
+        return self._known_theater_ids
+    
     def generate_theater_id(self) -> str:
         """
         Generate a unique 9-digit theater ID.
         
+        The ID is checked against the in-memory set of known IDs and reserved
+        there, so no database lookup is needed per ID. IDs taken by another
+        writer since the set was loaded are rejected by the unique index.
+        
         Returns:
             str: A 9-digit theater ID
         """
+        known_ids = self._load_known_theater_ids()
         while True:
             # Generate a random 9-digit number
             theater_id = str(random.randint(100000000, 999999999))
             
             # Check if this ID already exists
-            if not self.theaters_collection.find_one({"theater_id": theater_id}):
+            if theater_id not in known_ids:
+                known_ids.add(theater_id)
                 return theater_id
     
     def get_city_coordinates(self, city_name: str, use_fallback: bool = True) -> Optional[Dict]:
@@ -862,7 +1112,7 @@ class TheaterData:
         
         return None
     
-    def fetch_theaters_from_overpass(self, city_data: Dict[str, Any], brand: str) -> List[Dict[str, Any]]:
+    def fetch_theaters_from_overpass(self, city_data: Dict[str, Any], brand: str) -> List[Theater]:
         """
         Generate synthetic theater data for a city and brand.
         
@@ -871,12 +1121,13 @@ class TheaterData:
             brand: Theater brand to generate data for
             
         Returns:
-            List of theater dictionaries
+            List of Theater records
         """
         try:
             # Get city size based on population
             population = city_data.get('population', 0)
-            thresholds = self.config.theater.generation.population_thresholds
+            generation = self.config.theater.generation
+            thresholds = generation.population_thresholds
             
             if population >= thresholds['major_metro']:
                 city_size = 'major_metro'
@@ -888,34 +1139,50 @@ class TheaterData:
                 city_size = 'small_city'
             
             # Get theater count range for this brand and city size
-            count_range = self.config.theater.generation.theater_counts[city_size].get(brand, [0, 0])
+            count_range = generation.theater_counts[city_size].get(brand, [0, 0])
             num_theaters = random.randint(count_range[0], count_range[1])
             
             if num_theaters == 0:
                 return []
             
-            theaters = []
             city_name = city_data['name']
             state = city_data.get('state', '')
             
-            # Get naming pattern for this brand and city size
-            naming_pattern = self.config.theater.generation.naming_patterns[brand][city_size]
+            # Get naming pattern for this brand and city size, compiled once per pair
+            naming_pattern = generation.naming_patterns[brand][city_size]
+            format_name = self._name_formatters.get((brand, city_size))
+            if format_name is None:
+                format_name = compile_name_pattern(naming_pattern)
+                self._name_formatters[(brand, city_size)] = format_name
+            uses_number = '{number}' in naming_pattern
+            brand_label = brand.upper()
+            suffixes = generation.suffixes.get(brand, [''])
             
             # Get feature distribution for this city size
-            feature_distribution = self.config.theater.generation.feature_distribution[city_size]
+            feature_distribution = generation.feature_distribution[city_size]
+            chance_4dx = feature_distribution["4DX"]
+            chance_imax = feature_distribution["IMAX"]
+            
+            street_names = generation.street_names
+            last_updated = datetime.utcnow().isoformat()
+            
+            # Fixed prefixes for the per-theater ID and website
+            unique_id_prefix = f"{brand}_{city_name}_"
+            website_prefix = f"https://www.{brand.lower()}.com/theaters/{city_name.lower().replace(' ', '-')}-"
             
+            theaters = []
             for i in range(num_theaters):
                 # Generate theater name based on pattern
-                theater_name = naming_pattern.format(
-                    brand=brand.upper(),
-                    city=city_name,
-                    number=str(random.randint(8, 24)) if '{number}' in naming_pattern else '',
-                    suffix=random.choice(self.config.theater.generation.suffixes.get(brand, ['']))
-                ).strip()
+                theater_name = format_name(
+                    brand_label,
+                    city_name,
+                    str(random.randint(8, 24)) if uses_number else '',
+                    random.choice(suffixes)
+                )
                 
                 # Generate address
                 street_number = random.randint(100, 9999)
-                street_name = random.choice(self.config.theater.generation.street_names)
+                street_name = random.choice(street_names)
                 address = f"{street_number} {street_name}"
                 
                 # Generate random coordinates (US coordinates)
@@ -926,39 +1193,36 @@ class TheaterData:
                 features = ["2D", "3D"]  # All theaters have 2D and 3D
                 
                 # Add 4DX based on distribution
-                if random.random() * 100 < feature_distribution["4DX"]:
+                if random.random() * 100 < chance_4dx:
                     features.append("4DX")
                 
                 # Add IMAX based on distribution
-                if random.random() * 100 < feature_distribution["IMAX"]:
+                if random.random() * 100 < chance_imax:
                     features.append("IMAX")
                 
-                # Generate random phone number
-                area_code = random.randint(200, 999)
-                prefix = random.randint(200, 999)
-                line_number = random.randint(1000, 9999)
-                phone = f"({area_code}) {prefix}-{line_number}"
+                # Generate random phone number and ZIP code
+                phone, zip_code = random_phone_and_zip()
                 
                 # Generate website
-                website = f"https://www.{brand.lower()}.com/theaters/{city_name.lower().replace(' ', '-')}-{i+1}"
+                website = f"{website_prefix}{i+1}"
                 
-                theater = {
-                    'unique_id': f"{brand}_{city_name}_{i+1}",
-                    'name': theater_name,
-                    'brand': brand,
-                    'source_city': city_name,
-                    'city_geoid': city_data.get('geoid', ''),
-                    'location': {
+                theater = Theater(
+                    unique_id=f"{unique_id_prefix}{i+1}",
+                    name=theater_name,
+                    brand=brand,
+                    source_city=city_name,
+                    city_geoid=city_data.get('geoid', ''),
+                    location={
                         'type': 'Point',
                         'coordinates': [lon, lat]
                     },
-                    'address': {
+                    address={
                         'street': address,
                         'city': city_name,
                         'state': state,
-                        'zip': f"{random.randint(10000, 99999)}"
+                        'zip': zip_code
                     },
-                    'contact': {
+                    contact={
                         'phone': phone,
                         'website': website,
                         'opening_hours': {
@@ -971,9 +1235,9 @@ class TheaterData:
                             'sunday': "10:00-23:00"
                         }
                     },
-                    'features': features,
-                    'last_updated': datetime.utcnow().isoformat()
-                }
+                    features=features,
+                    last_updated=last_updated
+                )
                 
                 theaters.append(theater)
             
@@ -983,7 +1247,7 @@ class TheaterData:
             logger.error(f"Error generating theater data: {str(e)}")
             return []
     
-    def fetch_theaters(self, city_name: str = "Tampa, Florida", city_data: Dict = None) -> List[Dict[str, Any]]:
+    def fetch_theaters(self, city_name: str = "Tampa, Florida", city_data: Dict = None) -> List[Theater]:
         """
         Generate theater data for a city.
         
@@ -992,7 +1256,7 @@ class TheaterData:
             city_data: Optional city data dictionary with additional info
             
         Returns:
-            List of theater dictionaries
+            List of Theater records
         """
         if not city_data:
             # Try to get city data from MongoDB
@@ -1052,6 +1316,8 @@ class TheaterData:
         imported_count = 0
         operations = []
         mongodb_batch_size = self.config.processing.mongodb_batch_size
+        # One import shares a single timestamp
+        last_updated = datetime.now().isoformat()
         
         for geoid, city_data in tqdm(cities_data.items()):
             # Add geoid to the data
@@ -1060,14 +1326,14 @@ class TheaterData:
             # Set processed flag to False
             city_data["processed"] = False
             city_data["theaters_found"] = 0
-            city_data["last_updated"] = datetime.now().isoformat()
+            city_data["last_updated"] = last_updated
             
             try:
                 # Add to operations list
                 operations.append(
                     UpdateOne(
                     {"geoid": geoid},
-                    {"$set": city_data},
+                    {"$set": city_data, "$setOnInsert": {"random_key": random.random()}},
                     upsert=True
                     )
                 )
@@ -1095,12 +1361,49 @@ class TheaterData:
         log_progress(f"Successfully imported {imported_count} cities to MongoDB")
         return imported_count
     
-    def save_theaters_to_mongodb(self, theaters: List[Dict[str, Any]], city_geoid: str = None) -> int:
+    def normalize_city_processed_flags(self) -> int:
+        """
+        Set processed to False on cities where it is missing or null.
+        
+        Unprocessed cities are selected with an equality match on
+        processed: False, which the (processed, ...) indexes can serve
+        directly, unlike a negative $ne predicate.
+        
+        Returns:
+            int: Number of cities updated
+        """
+        result = self.cities_collection.update_many(
+            {"processed": {"$nin": [True, False]}},
+            {"$set": {"processed": False}}
+        )
+        if result.modified_count:
+            log_progress(f"Marked {result.modified_count} cities without a processed flag as unprocessed")
+        return result.modified_count
+    
+    def ensure_city_random_keys(self) -> int:
+        """
+        Give every city without one a persistent random sort key.
+        
+        Sorting on the indexed random_key field yields a random processing
+        order from a single cursor, without running $sample per batch.
+        
+        Returns:
+            int: Number of cities that received a key
+        """
+        result = self.cities_collection.update_many(
+            {"random_key": {"$exists": False}},
+            [{"$set": {"random_key": {"$rand": {}}}}]
+        )
+        if result.modified_count:
+            log_progress(f"Assigned random keys to {result.modified_count} cities")
+        return result.modified_count
+    
+    def save_theaters_to_mongodb(self, theaters: List[Union[Theater, Dict[str, Any]]], city_geoid: str = None) -> int:
         """
         Save theaters to MongoDB with unique 9-digit IDs.
         
         Args:
-            theaters: List of theater dictionaries
+            theaters: List of Theater records or theater dictionaries
             city_geoid: Optional city GEOID
             
         Returns:
@@ -1108,45 +1411,80 @@ class TheaterData:
         """
         if not theaters:
             return 0
-            
-        # Generate unique theater IDs
-        existing_ids = set(self.theaters_collection.distinct("theater_id"))
-        for theater in theaters:
-            while True:
-                theater_id = self.generate_theater_id()
-                if theater_id not in existing_ids:
-                    existing_ids.add(theater_id)
-                    theater["theater_id"] = theater_id
-                    break
+        
+        theaters = theaters_to_documents(theaters)
         
         # Add city_geoid if provided
         if city_geoid:
             for theater in theaters:
                 theater["city_geoid"] = city_geoid
         
-        # Save to MongoDB
-        result = self.theaters_collection.insert_many(theaters)
+        return self.save_theaters_to_mongodb_bulk(theaters)
+    
+    def save_theaters_to_mongodb_bulk(self, theaters: List[Union[Theater, Dict[str, Any]]]) -> int:
+        """
+        Save theaters from any number of cities with a single unordered insert.
+        
+        Args:
+            theaters: List of Theater records or theater dictionaries
+            
+        Returns:
+            int: Number of theaters saved
+        """
+        if not theaters:
+            return 0
+        
+        theaters = theaters_to_documents(theaters)
+            
+        # Generate unique theater IDs
+        for theater in theaters:
+            theater["theater_id"] = self.generate_theater_id()
+        
+        # Save to MongoDB in one round trip
+        result = self.theaters_collection.insert_many(theaters, ordered=False)
         return len(result.inserted_ids)
     
     def mark_city_as_processed(self, city_geoid: str, theaters_found: int = 0, error: str = None) -> bool:
         """Mark a city as processed in MongoDB."""
+        return self.mark_cities_as_processed([(city_geoid, theaters_found, error)])
+    
+    def mark_cities_as_processed(self, marks: List[tuple]) -> bool:
+        """
+        Mark several cities as processed in a single round trip.
+        
+        Args:
+            marks: List of (city_geoid, theaters_found, error) tuples; error may be None
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not marks:
+            return True
+        
         try:
-            update_data = {
-                "processed": True,
-                "theaters_found": theaters_found,
-                "processed_at": datetime.now().isoformat()
-            }
+            processed_at = datetime.now().isoformat()
+            
+            # Cities sharing a result get one UpdateMany, so a typical batch
+            # (mostly zero-theater cities) needs only a few operations
+            geoids_by_result = {}
+            for city_geoid, theaters_found, error in marks:
+                geoids_by_result.setdefault((theaters_found, error), []).append(city_geoid)
+            
+            operations = []
+            for (theaters_found, error), city_geoids in geoids_by_result.items():
+                update_data = {
+                    "processed": True,
+                    "theaters_found": theaters_found,
+                    "processed_at": processed_at
+                }
+                if error:
+                    update_data["error"] = error
+                operations.append(UpdateMany({"geoid": {"$in": city_geoids}}, {"$set": update_data}))
             
-            if error:
-                update_data["error"] = error
-                
-            self.cities_collection.update_one(
-                {"geoid": city_geoid},
-                {"$set": update_data}
-            )
+            self.cities_collection.bulk_write(operations, ordered=False)
             return True
         except Exception as e:
-            log_progress(f"Error marking city {city_geoid} as processed: {str(e)}", level="error")
+            log_progress(f"Error marking {len(marks)} cities as processed: {str(e)}", level="error")
             return False
     
     def save_progress(self, progress_data: Dict[str, Any]) -> bool:
@@ -1170,8 +1508,10 @@ class TheaterData:
             log_progress(f"Error getting last progress: {str(e)}", level="error")
             return {}
     
-    def save_theaters(self, theaters: List[Dict[str, Any]], output_file: str = None) -> None:
+    def save_theaters(self, theaters: List[Union[Theater, Dict[str, Any]]], output_file: str = None) -> None:
         """Save theater data to a JSON file for backup or offline use."""
+        theaters = theaters_to_documents(theaters)
+        
         # Use config if output_file not provided
         if output_file is None:
             output_file = self.config.output.get_file_path("theaters")
@@ -1181,10 +1521,7 @@ class TheaterData:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Use indent if pretty JSON is enabled
-            indent = 2 if self.config.output.pretty_json else None
-            json.dump(theaters, f, ensure_ascii=False, indent=indent)
+        write_json_array(output_file, theaters, pretty=self.config.output.pretty_json)
 
     def export_all_theaters_to_json(self, output_file=None) -> bool:
         """
@@ -1200,31 +1537,29 @@ class TheaterData:
             if output_file is None:
                 output_file = config.output.get_file_path("theaters")
             
-            # Get all theaters from MongoDB
-            theaters = list(self.theaters_collection.find({}, {"_id": 0}))
-            
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
             
-            # Save to JSON file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if config.output.pretty_json:
-                    json.dump(theaters, f, ensure_ascii=False, indent=2)
-                else:
-                    json.dump(theaters, f, ensure_ascii=False)
-            
-            # Generate brand summary
+            # Generate the brand summary while theaters stream to the file
             brands = {}
-            for theater in theaters:
-                brand = theater.get("brand", "other")
-                brands[brand] = brands.get(brand, 0) + 1
+            
+            def count_brands(theaters):
+                for theater in theaters:
+                    brand = theater.get("brand", "other")
+                    brands[brand] = brands.get(brand, 0) + 1
+                    yield theater
+            
+            # Stream theaters from MongoDB straight to the JSON file
+            cursor = self.theaters_collection.find({}, {"_id": 0}).batch_size(config.output.export_batch_size)
+            with contextlib.closing(cursor):
+                theater_count = write_json_array(output_file, count_brands(cursor), pretty=config.output.pretty_json)
             
             # Log summary
             log_progress("Theater brand summary:")
             for brand, count in brands.items():
                 log_progress(f"  {brand}: {count} theaters")
             
-            log_progress(f"Successfully exported {len(theaters)} theaters to {output_file}", level="info")
+            log_progress(f"Successfully exported {theater_count} theaters to {output_file}", level="info")
             return True
             
         except Exception as e:
@@ -1255,7 +1590,7 @@ class TheaterData:
             if isinstance(batch_size_or_cities, int):
                 # Get next batch of unprocessed cities
                 cities = list(self.cities_collection.find(
-                    {"processed": {"$ne": True}},
+                    {"processed": False},
                     limit=batch_size_or_cities
                 ))
             else:
@@ -1267,6 +1602,11 @@ class TheaterData:
             
             log_progress(f"Processing batch of {len(cities)} cities", level="info")
             
+            # Theaters and city marks are buffered and written once per batch;
+            # each city records where its theaters start in the buffer
+            pending_theaters = []
+            pending_cities = []
+            
             # Process each city
             for city in cities:
                 try:
@@ -1276,16 +1616,8 @@ class TheaterData:
                     
                     theaters = self.fetch_theaters(city_name, city)
                     
-                    if theaters:
-                        # Save theaters to MongoDB
-                        saved_count = self.save_theaters_to_mongodb(theaters, city.get('geoid'))
-                        stats["theaters_found"] += saved_count
-                        
-                        # Mark city as processed
-                        self.mark_city_as_processed(city.get('geoid'), saved_count)
-                    else:
-                        # Mark city as processed with 0 theaters
-                        self.mark_city_as_processed(city.get('geoid'), 0)
+                    pending_cities.append((city.get('geoid'), len(pending_theaters), len(theaters)))
+                    pending_theaters.extend(theaters)
                     
                     stats["processed_cities"] += 1
                     
@@ -1301,7 +1633,37 @@ class TheaterData:
                     stats["errors"] += 1
                     if self.config.processing.error_handling == "abort":
                         stats["status"] = "aborted"
-                        return stats
+                        break
+            
+            # Save all theaters for the batch, then mark their cities as processed
+            failed_indexes = set()
+            insert_error = None
+            try:
+                stats["theaters_found"] += self.save_theaters_to_mongodb_bulk(pending_theaters)
+            except BulkWriteError as e:
+                # The other cities' theaters are stored and their cities must still be marked
+                inserted, failed_indexes, errmsg = summarize_bulk_write_error(e)
+                log_progress(f"Failed to insert {len(pending_theaters) - inserted} of {len(pending_theaters)} theaters: {errmsg}", level="warning")
+                stats["theaters_found"] += inserted
+                stats["errors"] += 1
+            except Exception as e:
+                # After a network failure it is unknown which theaters were written
+                insert_error = f"Theater insert failed, stored theaters unknown: {str(e)}"
+                log_progress(f"Failed to insert {len(pending_theaters)} theaters: {str(e)}", level="error")
+                stats["errors"] += 1
+            
+            # Cities with failed theaters are still marked, with the error recorded,
+            # so a rerun does not duplicate the theaters that were written; cities
+            # carrying an error can be found and reprocessed deliberately
+            pending_marks = []
+            for city_geoid, start, count in pending_cities:
+                if insert_error:
+                    pending_marks.append((city_geoid, 0, insert_error))
+                    continue
+                failed = sum(1 for index in range(start, start + count) if index in failed_indexes)
+                error = f"{failed} of {count} theaters failed to insert" if failed else None
+                pending_marks.append((city_geoid, count - failed, error))
+            self.mark_cities_as_processed(pending_marks)
             
             return stats
             
@@ -1384,14 +1746,14 @@ def fetch_theaters_from_us_cities():
     # Get cities by selection strategy
     city_selection = config.theater.city_selection
     if city_selection == "population":
-        cities = theater_data.get_cities_by_population()
+        cities = theater_data.get_cities_by_population(config.theater.max_cities)
     elif city_selection == "random":
         # Use process_random_cities instead
         process_random_cities()
         return
     else:
         # Default to population order
-        cities = theater_data.get_cities_by_population()
+        cities = theater_data.get_cities_by_population(config.theater.max_cities)
     
     if cities:
         logger.info(f"Processing {len(cities)} cities using {city_selection} selection strategy")
@@ -1406,22 +1768,31 @@ def fetch_theaters_from_us_cities():
             
             logger.info(f"Processing batch {i//batch_size + 1}: cities {i+1}-{i+len(batch)} of {len(cities)}")
             
-            # Fetch theaters for this batch
-            theaters = theater_data.fetch_theaters(city_names)
-            
-            # Save theaters to MongoDB
-            for city_data, city_name in zip(batch, city_names):
-                city_theaters = [t for t in theaters if t["source_city"] == city_name]
-                if city_theaters:
-                    saved = theater_data.save_theaters_to_mongodb(city_theaters, city_data.get("geoid"))
-                    theater_data.mark_city_as_processed(city_data["geoid"], len(city_theaters))
-                    logger.info(f"Saved {saved} theaters for {city_name}")
-                    total_theaters += saved
-                else:
-                    theater_data.mark_city_as_processed(city_data["geoid"], 0)
-                    logger.info(f"No theaters found for {city_name}")
-                
-                processed_count += 1
+            # Fetch and save theaters city by city
+            marks = []
+            try:
+                for city_data, city_name in zip(batch, city_names):
+                    city_theaters = theater_data.fetch_theaters(city_name, city_data)
+                    if city_theaters:
+                        error = None
+                        try:
+                            saved = theater_data.save_theaters_to_mongodb(city_theaters, city_data.get("geoid"))
+                        except BulkWriteError as e:
+                            saved, _, errmsg = summarize_bulk_write_error(e)
+                            error = f"{len(city_theaters) - saved} of {len(city_theaters)} theaters failed to insert"
+                            logger.warning(f"Failed to insert {len(city_theaters) - saved} of {len(city_theaters)} theaters for {city_name}: {errmsg}")
+                        marks.append((city_data["geoid"], saved, error))
+                        logger.info(f"Saved {saved} theaters for {city_name}")
+                        total_theaters += saved
+                    else:
+                        marks.append((city_data["geoid"], 0, None))
+                        logger.info(f"No theaters found for {city_name}")
+                    
+                    processed_count += 1
+            finally:
+                # Mark the batch's completed cities at once, even if a later city failed,
+                # so a rerun does not duplicate the theaters already stored
+                theater_data.mark_cities_as_processed(marks)
             
             # Add delay between batches
             if i + batch_size < len(cities):
@@ -1454,80 +1825,74 @@ def process_random_cities(batch_size=None):
     
     # Import cities to MongoDB
     theater_data.import_cities_to_mongodb()
-    
-    # Count total unprocessed cities
-    total_cities = theater_data.cities_collection.count_documents({
-        "processed": {"$ne": True},
-        "population": {"$exists": True, "$ne": None}
-    })
+    theater_data.ensure_city_random_keys()
     
     # Check if we should limit the number of cities to process
     max_cities = config.theater.max_cities
     if max_cities is not None and max_cities > 0:
-        cities_to_process = min(total_cities, max_cities)
-        logger.info(f"Found {total_cities} unprocessed cities, but will only process {cities_to_process} as configured")
+        logger.info(f"Processing up to {max_cities} unprocessed cities in random order as configured")
     else:
-        cities_to_process = total_cities
-        logger.info(f"Found {total_cities} unprocessed cities to process in random order")
-    
-    if cities_to_process == 0:
-        logger.info("No unprocessed cities found, nothing to do")
-        return
-            
-    # Calculate number of batches needed
-    total_batches = (cities_to_process + batch_size - 1) // batch_size
+        max_cities = None
+        logger.info("Processing all unprocessed cities in random order")
+    
+    # Stream unprocessed cities in random_key order from a single cursor
+    cursor = theater_data.cities_collection.find(
+        {"processed": False, "population": {"$exists": True, "$ne": None}},
+        sort=[("random_key", 1)],
+        no_cursor_timeout=True
+    ).batch_size(batch_size)
+    if max_cities is not None:
+        cursor = cursor.limit(max_cities)
     
     # Process cities in random batches
     cities_processed = 0
     theaters_found = 0
+    batch_num = 0
     
-    for batch_num in range(1, total_batches + 1):
-        # Check if we've reached the max cities limit
-        if max_cities is not None and cities_processed >= max_cities:
-            logger.info(f"Reached max cities limit of {max_cities}, stopping")
-            break
+    def fetch_next_batch():
+        return list(itertools.islice(cursor, batch_size))
+    
+    # The next batch is fetched on a background thread while the current one
+    # is processed; only that thread ever reads from the cursor
+    with contextlib.closing(cursor), concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetcher:
+        next_batch = prefetcher.submit(fetch_next_batch)
+        while True:
+            city_batch = next_batch.result()
             
-        # Calculate how many cities to get for this batch
-        if max_cities is not None:
-            remaining = max_cities - cities_processed
-            batch_size_for_this_batch = min(batch_size, remaining)
-        else:
-            batch_size_for_this_batch = batch_size
+            if not city_batch:
+                break
             
-        # Create a pipeline to get a random batch of unprocessed cities
-        pipeline = [
-            {"$match": {"processed": {"$ne": True}, "population": {"$exists": True, "$ne": None}}},
-            {"$sample": {"size": batch_size_for_this_batch}}
-        ]
-        
-        # Get a random batch
-        city_batch = list(theater_data.cities_collection.aggregate(pipeline))
-        
-        if not city_batch:
-            logger.info("No more cities to process, finished early")
-            break
+            next_batch = prefetcher.submit(fetch_next_batch)
             
-        logger.info(f"Processing batch {batch_num}/{total_batches}: {len(city_batch)} random cities")
-        
-        # Process this batch
-        batch_stats = theater_data.process_batch_of_cities(city_batch, delay_between_cities=config.theater.delay_between_cities)
-        
-        # Update counters
-        cities_processed += batch_stats["processed_cities"]
-        theaters_found += batch_stats["theaters_found"]
-        
-        logger.info(f"Batch {batch_num} complete: processed {batch_stats['processed_cities']} cities, found {batch_stats['theaters_found']} theaters")
-        logger.info(f"Progress: {cities_processed}/{cities_to_process} cities processed ({(cities_processed/cities_to_process)*100:.1f}%)")
-        
-        # Add delay between batches
-        if batch_num < total_batches:
-            delay = config.theater.delay_between_batches
-            if delay > 0:
-                logger.info(f"Pausing for {delay} seconds before next batch")
-                time.sleep(delay)
+            # Add delay between batches
+            if batch_num > 0:
+                delay = config.theater.delay_between_batches
+                if delay > 0:
+                    logger.info(f"Pausing for {delay} seconds before next batch")
+                    time.sleep(delay)
+            
+            batch_num += 1
+            logger.info(f"Processing batch {batch_num}: {len(city_batch)} random cities")
             
+            # Process this batch
+            batch_stats = theater_data.process_batch_of_cities(city_batch)
+            
+            # Update counters
+            cities_processed += batch_stats["processed_cities"]
+            theaters_found += batch_stats["theaters_found"]
+            
+            logger.info(f"Batch {batch_num} complete: processed {batch_stats['processed_cities']} cities, found {batch_stats['theaters_found']} theaters")
+            if max_cities is not None:
+                logger.info(f"Progress: {cities_processed}/{max_cities} cities processed ({(cities_processed/max_cities)*100:.1f}%)")
+            else:
+                logger.info(f"Progress: {cities_processed} cities processed")
+    
+    if batch_num == 0:
+        logger.info("No unprocessed cities found, nothing to do")
+        return
+    
     # Export theaters to JSON
-            theater_data.export_all_theaters_to_json()
+    theater_data.export_all_theaters_to_json()
     
     logger.info(f"Random city processing complete. Processed {cities_processed} cities, found {theaters_found} theaters.")
 
@@ -1557,6 +1922,43 @@ def fetch_movie_data(count: int = None, download_images: bool = None):
     return stats
 
 
+def write_json_array(output_file: str, documents: Iterable[Dict[str, Any]], pretty: bool = True) -> int:
+    """
+    Stream documents to a JSON array file one element at a time.
+    
+    Each document is serialized with orjson and written as UTF-8 bytes, so a
+    cursor can be passed directly without holding every document in memory.
+    Values orjson cannot encode natively (e.g. ObjectId) are written via str().
+    
+    Args:
+        output_file: Path to output JSON file
+        documents: Iterable of documents to write
+        pretty: Whether to indent the output
+        
+    Returns:
+        int: Number of documents written
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    count = 0
+    
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(b"[")
+        for document in documents:
+            data = orjson.dumps(document, default=str, option=option)
+            if pretty:
+                f.write(b",\n  " if count else b"\n  ")
+                f.write(data.replace(b"\n", b"\n  "))
+            else:
+                f.write(b"," if count else b"")
+                f.write(data)
+            count += 1
+        f.write(b"\n]" if pretty and count else b"]")
+    
+    return count
+
+
 def export_collection_to_json(collection: Collection, output_file: str) -> None:
     """
     Export a MongoDB collection to a JSON file.
@@ -1566,14 +1968,12 @@ def export_collection_to_json(collection: Collection, output_file: str) -> None:
         output_file: Path to output JSON file
     """
     try:
-        # Get all documents from collection
-        documents = list(collection.find({}, {"_id": 0}))
+        # Stream documents from the cursor straight to the JSON file, fetching
+        # them in the same bounded batches DataExporter uses
+        cursor = collection.find({}, {"_id": 0}).batch_size(config.output.export_batch_size)
+        count = write_json_array(output_file, cursor, pretty=True)
         
-        # Save to JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(documents, f, ensure_ascii=False, indent=2)
-            
-        log_progress(f"Exported {len(documents)} documents to {output_file}", level="info")
+        log_progress(f"Exported {count} documents to {output_file}", level="info")
     except Exception as e:
         log_progress(f"Error exporting collection to {output_file}: {str(e)}", level="error")
 
@@ -1587,8 +1987,9 @@ class DataExporter:
         try:
             # Connect to MongoDB
             log_progress("Connecting to MongoDB for data export...", level="info")
-            self.client = MongoClient(MONGODB_CONNECTION_STRING)
-            # Test connection
+            self.client = get_mongo_client()
+            
+            # The exporter creates no indexes, so test the connection here
             self.client.admin.command('ping')
             
             self.db = self.client[MONGODB_DATABASE]
@@ -1606,34 +2007,32 @@ class DataExporter:
             log_progress(f"Connection string: {mask_connection_string(MONGODB_CONNECTION_STRING)}", level="error")
             raise ConnectionError(f"Failed to connect to MongoDB: {error_msg}")
 
-    def _write_documents_to_file(self, documents: List[Dict], file_type: str) -> bool:
-        """Write documents to a JSON file."""
+    def _write_documents_to_file(self, documents: Iterable[Dict], file_type: str) -> Optional[int]:
+        """Stream documents to a JSON file and return how many were written."""
         try:
             output_path = self.config.output.get_file_path(file_type)
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if self.config.output.pretty_json:
-                    json.dump(documents, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(documents, f, ensure_ascii=False)
-            return True
+            return write_json_array(output_path, documents, pretty=self.config.output.pretty_json)
         except Exception as e:
             log_progress(f"Failed to write {file_type} to file: {e}", level="error")
-            return False
+            return None
 
     def export_collection(self, collection: Collection, file_type: str) -> bool:
         """Export a MongoDB collection to JSON file."""
         try:
-            documents = list(collection.find({}, {'_id': 0}))
-            if not documents:
+            cursor = collection.find({}, {'_id': 0}).batch_size(self.config.output.export_batch_size)
+            first_document = next(cursor, None)
+            if first_document is None:
                 log_progress(f"No documents found in {collection.name} collection", level="warning")
                 return False
             
-            success = self._write_documents_to_file(documents, file_type)
-            if success:
-                log_progress(f"Successfully exported {len(documents)} {collection.name} to {self.config.output.get_file_path(file_type)}", level="info")
-            return success
+            count = self._write_documents_to_file(itertools.chain([first_document], cursor), file_type)
+            if count is None:
+                return False
+            
+            log_progress(f"Successfully exported {count} {collection.name} to {self.config.output.get_file_path(file_type)}", level="info")
+            return True
         except Exception as e:
             log_progress(f"Failed to export {collection.name}: {e}", level="error")
             return False
@@ -1655,11 +2054,13 @@ class DataExporter:
         try:
             log_progress("Starting export of all data collections...", level="info")
             
-            movies_success = self.export_movies()
-            theaters_success = self.export_theaters()
-            showtimes_success = self.export_showtimes()
+            # Each export is a cursor-to-file pipeline, so run them concurrently
+            # to overlap MongoDB reads with disk writes
+            exports = (self.export_movies, self.export_theaters, self.export_showtimes)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                results = list(executor.map(lambda export: export(), exports))
             
-            all_success = movies_success and theaters_success and showtimes_success
+            all_success = all(results)
             if all_success:
                 log_progress("Successfully exported all collections", level="info")
             else:
@@ -1670,27 +2071,102 @@ class DataExporter:
             return False
 
 
+# Fields read from theater and movie documents during showtime generation
+SHOWTIME_THEATER_PROJECTION = {"_id": 0, "theater_id": 1, "name": 1, "contact.opening_hours": 1, "features": 1}
+SHOWTIME_MOVIE_PROJECTION = {"_id": 0, "id": 1, "title": 1, "runtime": 1, "release_date": 1}
+
+# Premium formats a showtime can carry on top of 2D, in display order
+PREMIUM_SHOWTIME_FEATURES = ("3D", "4DX", "IMAX")
+
+# Theater cursor batch size used during showtime generation
+SHOWTIME_THEATER_BATCH_SIZE = 2000
+
+# Opening-hours keys, indexed by day offset from Monday
+_DAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# "HH:MM" label for every minute of the day, indexed by minutes since midnight
+_MINUTE_LABELS = tuple("%02d:%02d" % divmod(minute, 60) for minute in range(24 * 60))
+
+
+def _clock_to_minutes(clock: str) -> Optional[int]:
+    """Convert an "HH:MM" clock time to minutes since midnight, or None if invalid."""
+    hour, _, minute = clock.partition(":")
+    # isdigit() also accepts digits such as "²" that int() rejects
+    if not (hour.isascii() and hour.isdecimal() and minute.isascii() and minute.isdecimal()
+            and len(hour) <= 2 and len(minute) <= 2):
+        return None
+    
+    hour, minute = int(hour), int(minute)
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
+@functools.lru_cache(maxsize=None)
+def parse_hours_range(hours_str: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse an opening-hours string such as "10:00-23:00" into minutes since midnight.
+    
+    Theaters share a small set of hours strings, so each distinct string is
+    parsed once and the result reused for every theater and day.
+    
+    Args:
+        hours_str: Opening hours in "HH:MM-HH:MM" format
+        
+    Returns:
+        Tuple of (opening_minute, closing_minute), or None if the string is malformed.
+        A closing time after midnight is capped at the end of the day.
+    """
+    hours = hours_str.split("-")
+    if len(hours) != 2:
+        return None
+    
+    opening_minute = _clock_to_minutes(hours[0])
+    closing_minute = _clock_to_minutes(hours[1])
+    if opening_minute is None or closing_minute is None:
+        return None
+    
+    # Closing after midnight is capped at the end of the day
+    if closing_minute < opening_minute:
+        closing_minute = 23 * 60 + 59
+    
+    return opening_minute, closing_minute
+
+
 class ShowtimeGenerator:
     """Class for generating synthetic showtime data."""
     
     def __init__(self):
         """Initialize the ShowtimeGenerator with configuration."""
         self.config = get_config()
+        # Run-level state shared by every theater, set by _start_run
+        self._movies_in_window = None
+        self._show_dates = None
+        self._run_started_at = None
+        # Dedicated generator for movie selection and screening buffers
+        self.rng = random.Random()
         try:
             # Connect to MongoDB
             log_progress("Connecting to MongoDB for showtime generation...", level="info")
-            self.client = MongoClient(MONGODB_CONNECTION_STRING)
-            # Test connection
-            self.client.admin.command('ping')
+            self.client = get_mongo_client()
             
             self.db = self.client[MONGODB_DATABASE]
             
             # Initialize collections
             self.movies_collection = self.db[MONGODB_COLLECTION_MOVIES]
             self.theaters_collection = self.db[MONGODB_COLLECTION_THEATERS]
-            self.showtimes_collection = self.db[self.config.showtime_generation.collections["showtimes"]]
+            # Showtimes are synthetic, so inserts skip waiting on the journal
+            self.showtimes_collection = self.db.get_collection(
+                self.config.showtime_generation.collections["showtimes"],
+                write_concern=WriteConcern(w=1, j=False)
+            )
             self.cities_collection = self.db[MONGODB_COLLECTION_CITIES]
             
+            # Create indexes for the release-window query, showtime lookups and state filtering
+            self.movies_collection.create_index("release_date")
+            self.showtimes_collection.create_index([("theater_id", 1), ("date", 1)])
+            self.cities_collection.create_index([("state", 1), ("geoid", 1)])
+            
             log_progress("MongoDB connection successful for showtime generation", level="info")
         except Exception as e:
             error_msg = str(e)
@@ -1699,75 +2175,98 @@ class ShowtimeGenerator:
             log_progress(f"Connection string: {mask_connection_string(MONGODB_CONNECTION_STRING)}", level="error")
             raise ConnectionError(f"Failed to connect to MongoDB: {error_msg}")
     
-    def _get_theaters_by_state(self, state: str) -> List[Dict]:
+    def _get_state_theater_filter(self, state: str) -> Optional[Dict[str, Any]]:
         """
-        Get all theaters in a specific state.
+        Build the theaters query for a specific state.
         
         Args:
             state: State code or full name
         
         Returns:
-            List of theater documents
+            Query matching theaters in the state's cities, or None if the state has no cities
         """
-        # First get all cities in the state
-        cities = list(self.cities_collection.find({"state": state}))
-        if not cities:
+        # Get the GEOIDs of all cities in the state; the (state, geoid)
+        # index covers this query, so no city documents are fetched
+        city_geoids = [city["geoid"] for city in self.cities_collection.find({"state": state}, {"_id": 0, "geoid": 1})]
+        if not city_geoids:
             log_progress(f"No cities found for state: {state}", level="warning")
-            return []
-            
-        city_geoids = [city["geoid"] for city in cities]
+            return None
         
-        # Then get all theaters in those cities
-        theaters = list(self.theaters_collection.find({"city_geoid": {"$in": city_geoids}}))
-        log_progress(f"Found {len(theaters)} theaters in state: {state}", level="info")
-        return theaters
+        return {"city_geoid": {"$in": city_geoids}}
     
-    def _get_available_features(self, movie: Dict, theater: Dict) -> List[str]:
+    def _get_available_features(self, theater: Dict) -> List[str]:
         """
-        Determine available features for a showtime based on movie and theater capabilities.
+        Determine available features for a showtime based on theater capabilities.
         
         Args:
-            movie: Movie document from MongoDB
             theater: Theater document from MongoDB
             
         Returns:
             List of available features
         """
-        features = ["2D"]  # All showings have 2D
+        theater_features = frozenset(theater.get("features", ()))
         
-        # Add 3D if available
-        if "3D" in theater["features"]:
-            features.append("3D")
+        # All showings have 2D, plus whichever premium formats the theater offers
+        return ["2D"] + [feature for feature in PREMIUM_SHOWTIME_FEATURES if feature in theater_features]
+    
+    def _parse_opening_hours(self, theater: Dict) -> List[Optional[Tuple[int, int]]]:
+        """
+        Parse a theater's weekly opening hours into minutes since midnight.
         
-        # Add 4DX if available
-        if "4DX" in theater["features"]:
-            features.append("4DX")
+        Args:
+            theater: Theater document from MongoDB
+            
+        Returns:
+            List of 7 (opening_minute, closing_minute) tuples, Monday first,
+            with None for days that have no usable hours
+        """
+        opening_hours = theater["contact"]["opening_hours"]
+        theater_hours = []
         
-        # Add IMAX if available
-        if "IMAX" in theater["features"]:
-            features.append("IMAX")
+        for day_name in _DAY_NAMES:
+            hours_str = opening_hours.get(day_name)
+            theater_hours.append(parse_hours_range(hours_str) if isinstance(hours_str, str) else None)
         
-        return features
+        return theater_hours
     
-    def _generate_theater_showtimes(self, theater: Dict) -> List[Dict]:
-        showtimes = []
+    def _load_movies_in_window(self) -> List[Dict]:
+        """
+        Fetch the movies released within the configured release window.
+        
+        Returns:
+            List of movie documents limited to SHOWTIME_MOVIE_PROJECTION fields,
+            with a usable runtime on every movie
+        """
         release_window = datetime.now() - timedelta(weeks=self.config.showtime_generation.showtimes["release_window_weeks"])
-        movies = list(self.movies_collection.find({
-            "release_date": {"$exists": True, "$ne": None}
-        }))
         
-        if not movies:
-            log_progress(f"No movies found for theater {theater.get('name')}", level="warning")
-            return showtimes
+        # release_date is stored as YYYY-MM-DD, so the window filter is an indexed string comparison
+        movies = list(self.movies_collection.find(
+            {"release_date": {"$gte": release_window.strftime("%Y-%m-%d")}},
+            SHOWTIME_MOVIE_PROJECTION
+        ))
         
-        movies_in_window = []
+        # Normalize per-movie values here once rather than for every theater;
+        # TMDB reports unknown runtimes as null or 0
         for movie in movies:
-            try:
-                release_date = datetime.strptime(movie["release_date"], "%Y-%m-%d")
-                if release_date >= release_window:
-                    movies_in_window.append(movie)
-            except (ValueError, TypeError):
-                continue
+            if not movie.get("runtime"):
+                movie["runtime"] = 120
+        
+        return movies
+    
+    def _start_run(self) -> None:
+        """Capture the release window, show dates and timestamp shared by a generation run."""
+        now = datetime.now()
+        self._movies_in_window = self._load_movies_in_window()
+        # Dates for the next 7 days, indexed by day offset
+        self._show_dates = [(now + timedelta(days=day)).strftime("%Y-%m-%d") for day in range(7)]
+        self._run_started_at = now.isoformat()
+    
+    def _generate_theater_showtimes(self, theater: Dict) -> List[Dict]:
+        showtimes = []
+        
+        if self._movies_in_window is None:
+            self._start_run()
+        movies_in_window = self._movies_in_window
         
         if not movies_in_window:
             log_progress(f"No movies found within {self.config.showtime_generation.showtimes['release_window_weeks']} week release window for theater {theater.get('name')}", level="warning")
@@ -1779,53 +2278,63 @@ class ShowtimeGenerator:
         if max_movies is None:
             max_movies = len(movies_in_window)
         
-        num_movies = random.randint(min_movies, min(max_movies, len(movies_in_window)))
-        theater_movies = random.sample(movies_in_window, num_movies)
+        rng = self.rng
+        num_movies = rng.randint(min_movies, min(max_movies, len(movies_in_window)))
+        theater_movies = rng.sample(movies_in_window, num_movies)
+        
+        buffer_time_range = self.config.showtime_generation.showtimes["buffer_time_range"]
+        buffer_min = buffer_time_range["min"]
+        buffer_values = range(buffer_min, buffer_time_range["max"] + 1)
+        
+        # Show dates and the creation timestamp are shared by every showtime in the run
+        show_dates = self._show_dates
+        created_at = self._run_started_at
+        
+        # Opening hours are parsed once per theater, not once per movie
+        theater_hours = self._parse_opening_hours(theater)
+        # Features depend only on the theater, so every slot shares one list
+        showtime_features = self._get_available_features(theater)
         
         for movie in theater_movies:
             try:
-                runtime = movie.get("runtime", 120)
+                runtime = movie["runtime"]
                 
-                for day in range(7):
-                    day_name = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"][day]
-                    hours = theater["contact"]["opening_hours"][day_name].split("-")
-                    
-                    if not hours or len(hours) != 2:
+                # Only date and time vary between this movie's showtimes, so each slot
+                # copies a template; the placeholders keep the document field order
+                showtime_template = {
+                    "movie_id": movie["id"],
+                    "theater_id": theater["theater_id"],
+                    "date": None,
+                    "time": None,
+                    "runtime": runtime,
+                    "features": showtime_features,
+                    "available": True,
+                    "created_at": created_at
+                }
+                
+                for day, day_hours in enumerate(theater_hours):
+                    if day_hours is None:
                         continue
                     
-                    opening_time = datetime.strptime(hours[0], "%H:%M").time()
-                    closing_time = datetime.strptime(hours[1], "%H:%M").time()
+                    opening_minute, closing_minute = day_hours
                     
-                    if closing_time < opening_time:
-                        closing_time = datetime.strptime("23:59", "%H:%M").time()
+                    # Every slot advances at least runtime + buffer_min, which bounds the
+                    # slot count, so the day's buffers are drawn in a single call
+                    max_slots = (closing_minute - opening_minute) // max(runtime + buffer_min, 1) + 1
                     
-                    current_time = opening_time
-                    while current_time < closing_time:
-                        if (datetime.combine(datetime.today(), closing_time) - 
-                            datetime.combine(datetime.today(), current_time)).total_seconds() / 60 < runtime:
+                    show_date = show_dates[day]
+                    current_minute = opening_minute
+                    for buffer in rng.choices(buffer_values, k=max_slots):
+                        if current_minute >= closing_minute or closing_minute - current_minute < runtime:
                             break
                         
-                        showtime = {
-                            "movie_id": movie["id"],
-                            "theater_id": theater["theater_id"],
-                            "date": (datetime.now() + timedelta(days=day)).strftime("%Y-%m-%d"),
-                            "time": current_time.strftime("%H:%M"),
-                            "runtime": runtime,
-                            "features": self._get_available_features(movie, theater),
-                            "available": True,
-                            "created_at": datetime.now().isoformat()
-                        }
+                        showtime = showtime_template.copy()
+                        showtime["date"] = show_date
+                        showtime["time"] = _MINUTE_LABELS[current_minute]
                         
                         showtimes.append(showtime)
                         
-                        buffer_time = random.randint(
-                            self.config.showtime_generation.showtimes["buffer_time_range"]["min"],
-                            self.config.showtime_generation.showtimes["buffer_time_range"]["max"]
-                        )
-                        total_time = runtime + buffer_time
-                        
-                        current_time = (datetime.combine(datetime.today(), current_time) + 
-                                      timedelta(minutes=total_time)).time()
+                        current_minute += runtime + buffer
                         
             except Exception as e:
                 log_progress(f"Error generating showtimes for movie {movie.get('title')} at theater {theater.get('name')}: {str(e)}", level="error")
@@ -1833,6 +2342,61 @@ class ShowtimeGenerator:
         
         return showtimes
     
+    def _insert_showtimes(self, showtimes: List[Dict]) -> int:
+        """
+        Insert showtimes with one unordered insert; safe to run on a worker thread.
+        
+        Args:
+            showtimes: Showtime documents to insert
+            
+        Returns:
+            Number of showtimes inserted; failures other than per-document
+            write errors are raised
+        """
+        if not showtimes:
+            return 0
+        
+        try:
+            self.showtimes_collection.insert_many(showtimes, ordered=False, bypass_document_validation=True)
+            return len(showtimes)
+        except BulkWriteError as e:
+            # Only the failed documents are lost
+            inserted, _, errmsg = summarize_bulk_write_error(e)
+            log_progress(f"Failed to insert {len(showtimes) - inserted} of {len(showtimes)} showtimes: {errmsg}", level="warning")
+            return inserted
+    
+    def _record_showtime_insert(self, insert: Callable[[], int], showtime_count: int, theater_count: int, stats: Dict[str, int]) -> None:
+        """
+        Wait for a showtime insert and add its result to the statistics.
+        
+        Theaters only count as processed once their showtimes are written, so a
+        failed insert is counted as a single error rather than against one theater.
+        
+        Args:
+            insert: Callable running the insert, or returning a background insert's result
+            showtime_count: Number of showtimes in the insert
+            theater_count: Number of theaters whose showtimes are in the insert
+            stats: Statistics dictionary to update
+        """
+        try:
+            stats["showtimes_generated"] += insert()
+            stats["theaters_processed"] += theater_count
+        except Exception as e:
+            log_progress(f"Failed to insert {showtime_count} showtimes from {theater_count} theaters: {str(e)}", level="error")
+            stats["errors"] += 1
+    
+    def _flush_showtimes(self, pending: List[Dict], theater_count: int, stats: Dict[str, int]) -> None:
+        """
+        Insert buffered showtimes into MongoDB, record the result and empty the buffer.
+        
+        Args:
+            pending: Buffered showtime documents; cleared after the insert
+            theater_count: Number of theaters whose showtimes are in the buffer
+            stats: Statistics dictionary to update
+        """
+        self._record_showtime_insert(functools.partial(self._insert_showtimes, pending), len(pending), theater_count, stats)
+        pending.clear()
+    
     def _process_state(self, state: str) -> Dict[str, int]:
         """
         Process showtime generation for a specific state.
@@ -1850,35 +2414,46 @@ class ShowtimeGenerator:
         }
         
         try:
-            # Get theaters in this state
-            theaters = self._get_theaters_by_state(state)
-            if not theaters:
+            # Count theaters in this state, then stream them from the cursor
+            theater_filter = self._get_state_theater_filter(state)
+            if theater_filter is None:
+                return stats
+            
+            theater_count = self.theaters_collection.count_documents(theater_filter)
+            if not theater_count:
+                log_progress(f"No theaters found in state: {state}", level="warning")
                 return stats
-                
-            log_progress(f"Processing {len(theaters)} theaters in state: {state}", level="info")
+            
+            theaters = self.theaters_collection.find(theater_filter, SHOWTIME_THEATER_PROJECTION).batch_size(SHOWTIME_THEATER_BATCH_SIZE)
+            log_progress(f"Processing {theater_count} theaters in state: {state}", level="info")
+            
+            # Showtimes are buffered across theaters and inserted in large batches
+            insert_batch_size = self.config.showtime_generation.insert_batch_size
+            pending_showtimes = []
+            buffered_theaters = 0
             
             # Create progress bar for theaters in this state
-            with tqdm(total=len(theaters), desc=f"Processing {state}", unit="theater", leave=False) as pbar:
+            with contextlib.closing(theaters), tqdm(total=theater_count, desc=f"Processing {state}", unit="theater", leave=False) as pbar:
                 # Process each theater
                 for theater in theaters:
                     try:
                         # Generate showtimes for this theater
-                        showtimes = self._generate_theater_showtimes(theater)
-                        if showtimes:
-                            # Save showtimes to MongoDB
-                            self.showtimes_collection.insert_many(showtimes)
-                            stats["showtimes_generated"] += len(showtimes)
-                        stats["theaters_processed"] += 1
-                        pbar.update(1)
-                        pbar.set_postfix({
-                            "showtimes": stats["showtimes_generated"],
-                            "errors": stats["errors"]
-                        })
+                        pending_showtimes.extend(self._generate_theater_showtimes(theater))
+                        buffered_theaters += 1
                     except Exception as e:
                         log_progress(f"Error processing theater {theater.get('name')} in {state}: {str(e)}", level="error")
                         stats["errors"] += 1
-                        pbar.update(1)
                     
+                    if len(pending_showtimes) >= insert_batch_size:
+                        self._flush_showtimes(pending_showtimes, buffered_theaters, stats)
+                        buffered_theaters = 0
+                    pbar.update(1)
+                    pbar.set_postfix({
+                        "showtimes": stats["showtimes_generated"],
+                        "errors": stats["errors"]
+                    })
+            
+            self._flush_showtimes(pending_showtimes, buffered_theaters, stats)
             return stats
             
         except Exception as e:
@@ -1895,17 +2470,23 @@ class ShowtimeGenerator:
         }
         
         try:
+            # Every theater shares the release window, show dates and creation timestamp
+            self._start_run()
+            
             if states is None:
                 if self.config.showtime_generation.state_filter_enabled:
                     states = self.config.showtime_generation.state_filter_states
                 else:
-                    theaters = list(self.theaters_collection.find())
-                    if not theaters:
+                    theater_count = self.theaters_collection.estimated_document_count()
+                    if not theater_count:
                         log_progress("No theaters found in database", level="error")
                         return stats
                     
-                    log_progress(f"Processing {len(theaters)} theaters across all states", level="info")
-                    return self._process_all_theaters(theaters)
+                    log_progress(f"Processing {theater_count} theaters across all states", level="info")
+                    # Theaters are streamed from the cursor rather than loaded up front
+                    cursor = self.theaters_collection.find({}, SHOWTIME_THEATER_PROJECTION).batch_size(SHOWTIME_THEATER_BATCH_SIZE)
+                    with contextlib.closing(cursor):
+                        return self._process_all_theaters(cursor)
             
             if not states:
                 log_progress("No states specified for processing", level="error")
@@ -1960,12 +2541,12 @@ class ShowtimeGenerator:
             stats["end_time"] = datetime.now().isoformat()
             return stats
     
-    def _process_all_theaters(self, theaters: List[Dict]) -> Dict[str, int]:
+    def _process_all_theaters(self, theaters: Iterable[Dict]) -> Dict[str, int]:
         """
         Process showtime generation for all theaters.
         
         Args:
-            theaters: List of theater documents
+            theaters: Iterable of theater documents, such as a cursor
             
         Returns:
             Dictionary with processing statistics
@@ -1976,19 +2557,37 @@ class ShowtimeGenerator:
             "errors": 0
         }
         
-        for theater in theaters:
-            try:
-                # Generate showtimes for this theater
-                showtimes = self._generate_theater_showtimes(theater)
-                if showtimes:
-                    # Save showtimes to MongoDB
-                    self.showtimes_collection.insert_many(showtimes)
-                    stats["showtimes_generated"] += len(showtimes)
-                stats["theaters_processed"] += 1
-            except Exception as e:
-                log_progress(f"Error processing theater {theater.get('name')}: {str(e)}", level="error")
-                stats["errors"] += 1
+        # Showtimes are buffered across theaters and inserted in large batches
+        insert_batch_size = self.config.showtime_generation.insert_batch_size
+        pending_showtimes = []
+        buffered_theaters = 0
+        
+        # Full buffers are inserted on a background thread while the next theaters
+        # are generated, since insert_many releases the GIL during network I/O. One
+        # insert is in flight at a time and stats are only updated on this thread.
+        in_flight = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as inserter:
+            for theater in theaters:
+                try:
+                    # Generate showtimes for this theater
+                    pending_showtimes.extend(self._generate_theater_showtimes(theater))
+                    buffered_theaters += 1
+                except Exception as e:
+                    log_progress(f"Error processing theater {theater.get('name')}: {str(e)}", level="error")
+                    stats["errors"] += 1
                 
+                if len(pending_showtimes) >= insert_batch_size:
+                    if in_flight is not None:
+                        self._record_showtime_insert(*in_flight, stats)
+                    insert = inserter.submit(self._insert_showtimes, pending_showtimes)
+                    in_flight = (insert.result, len(pending_showtimes), buffered_theaters)
+                    pending_showtimes = []
+                    buffered_theaters = 0
+            
+            if in_flight is not None:
+                self._record_showtime_insert(*in_flight, stats)
+        
+        self._flush_showtimes(pending_showtimes, buffered_theaters, stats)
         return stats
 
 def main():
@@ -2002,12 +2601,13 @@ def main():
     
     args = parser.parse_args()
     
+    # Logging is already initialized at import time, and reload_config
+    # re-initializes it for a custom configuration file
     if args.config:
         config = reload_config(args.config)
     else:
         config = get_config()
-    
-    config.initialize_logging()
+    theater_config = config.theater
     
     try:
         if args.movies_only:
@@ -2017,10 +2617,10 @@ def main():
             log_progress("Running theater data collection only", level="info")
             theater_data = TheaterData()
             theater_data.process_all_cities(
-                batch_size=config.theater.batch_size,
-                delay_between_batches=config.theater.delay_between_batches,
-                max_batches=config.theater.max_batches,
-                timeout_per_batch=config.theater.timeout_per_batch
+                batch_size=theater_config.batch_size,
+                delay_between_batches=theater_config.delay_between_batches,
+                max_batches=theater_config.max_batches,
+                timeout_per_batch=theater_config.timeout_per_batch
             )
         elif args.export_data:
             log_progress("Running data export only", level="info")
@@ -2044,10 +2644,10 @@ def main():
             
             theater_data = TheaterData()
             theater_data.process_all_cities(
-                batch_size=config.theater.batch_size,
-                delay_between_batches=config.theater.delay_between_batches,
-                max_batches=config.theater.max_batches,
-                timeout_per_batch=config.theater.timeout_per_batch
+                batch_size=theater_config.batch_size,
+                delay_between_batches=theater_config.delay_between_batches,
+                max_batches=theater_config.max_batches,
+                timeout_per_batch=theater_config.timeout_per_batch
             )
             
             generator = ShowtimeGenerator()